@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Response
 
-from app.core.clients import LineProviderClient
+from app.core.clients import LineProviderClient, get_line_provider_client
 from app.core.schemas import Bet, BetCreate
 from app.core.service.bets import BetsService
 from app.core.uow import UnitOfWork
@@ -10,42 +11,47 @@ router = APIRouter()
 
 @router.get("/events", status_code=200, response_model=list)
 async def get_all_events(
-    line_provider_client: LineProviderClient = Depends(LineProviderClient),
-) -> list:
+    line_provider_client: LineProviderClient = Depends(get_line_provider_client),
+) -> Response:
     """
     Retrieve all active events from the line provider.
 
+    The events are serialized with orjson and returned as a Response,
+    so they are not walked by the response model, which is only used to document the endpoint.
+
     Parameters:
     line_provider_client (LineProviderClient): The client used to interact with the line provider service.
 
     Returns:
-    list: A list of active events.
+    Response: A list of active events.
     """
-    return await BetsService.get_active_events(line_provider_client=line_provider_client)
+    events = await BetsService.get_active_events(line_provider_client=line_provider_client)
+    return Response(content=orjson.dumps(events), media_type="application/json")
 
 
 @router.get("/bets", status_code=200, response_model=list[Bet])
-async def get_bet_history(
-    uow: UnitOfWork = Depends(UnitOfWork), line_provider_client: LineProviderClient = Depends(LineProviderClient)
-) -> list[Bet]:
+async def get_bet_history(uow: UnitOfWork = Depends(UnitOfWork)) -> Response:
     """
     Retrieve the history of bets.
 
+    The bets are serialized with orjson and returned as a Response, so they are not validated
+    against the response model, which is only used to document the endpoint.
+
     Parameters:
     uow (UnitOfWork): The unit of work used to manage database transactions.
-    line_provider_client (LineProviderClient): The client used to interact with the line provider service.
 
     Returns:
-    list[Bet]: A list of Bet objects representing the bet history.
+    Response: A list of Bet objects representing the bet history.
     """
-    return await BetsService.get_bet_history(uow=uow, line_provider_client=line_provider_client)
+    bets = await BetsService.get_bet_history(uow=uow)
+    return Response(content=orjson.dumps(bets), media_type="application/json")
 
 
 @router.post("/bet", status_code=201, response_model=Bet)
 async def create_bet(
         bet: BetCreate,
         uow: UnitOfWork = Depends(UnitOfWork),
-        line_provider_client: LineProviderClient = Depends(LineProviderClient)
+        line_provider_client: LineProviderClient = Depends(get_line_provider_client),
 ) -> Bet:
     """
     Create a new bet.
@@ -57,7 +63,7 @@ async def create_bet(
     Parameters:
     bet (BetCreate): A BetCreate object containing the necessary information to create a new bet.
     uow (UnitOfWork): The unit of work used to manage database transactions.
-    line_provider_client (LineProviderClient): The client used to interact with the line provider service.
+    line_provider_client (LineProviderClient): The client used to check events that are not synced yet.
 
     Returns:
     Bet: A Bet object representing the newly created bet.
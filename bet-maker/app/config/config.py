@@ -9,7 +9,15 @@ class Settings(BaseSettings):
     HOST: str = "bet-maker-db"
     PORT: str = "5432"
     NAME: str = "bet-maker"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 10
+    DB_POOL_RECYCLE: int = 1800
     URL: str = "http://line-provider:5000"
+    URL_HTTP2: bool = False
+    REDIS_URL: str = "redis://redis:6379/0"
+    EVENTS_SYNC_INTERVAL: int = 5
+    BETS_CALCULATION_INTERVAL: int = 10
 
     @property
     def DB_URL(self):
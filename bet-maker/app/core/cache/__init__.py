@@ -0,0 +1 @@
+from .cache import cached, derive, redis_client
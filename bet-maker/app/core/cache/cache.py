@@ -0,0 +1,150 @@
+import asyncio
+import functools
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+import orjson
+from fastapi import HTTPException
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.utils import get_logger
+
+logger = get_logger(__file__, logging.DEBUG)
+
+redis_client = aioredis.from_url(settings.REDIS_URL)
+
+# Decoded bodies and values derived from them, keyed by cache key. A decoded body is reused for as long as
+# the Redis entry keeps the same generated_at, so it is parsed once per refresh rather than once per call.
+_decoded: dict[str, tuple[bytes, Any]] = {}
+_derived: dict[str, tuple[Any, Any]] = {}
+# Refreshes in progress, keyed by cache key. Concurrent misses on the same key await the same refresh.
+_inflight: dict[str, asyncio.Future] = {}
+
+
+async def _read(key: str) -> dict[bytes, bytes]:
+    """
+    Read a cache entry from Redis.
+
+    Parameters:
+    key (str): The Redis key of the entry.
+
+    Returns:
+    dict[bytes, bytes]: The fields of the entry, or an empty dict if it is missing or Redis is unavailable.
+    """
+    try:
+        return await redis_client.hgetall(key)
+    except RedisError as error:
+        logger.error(f"Failed to read cache entry {key}. Error: {error}")
+        return {}
+
+
+def _decode(key: str, entry: dict[bytes, bytes]) -> Any:
+    """
+    Decode the body of a cache entry, reusing the previous result if the entry has not been refreshed.
+
+    Parameters:
+    key (str): The Redis key of the entry.
+    entry (dict[bytes, bytes]): The fields of the entry.
+
+    Returns:
+    Any: The decoded body.
+    """
+    generated_at = entry[b"generated_at"]
+    decoded = _decoded.get(key)
+    if decoded is not None and decoded[0] == generated_at:
+        return decoded[1]
+    value = orjson.loads(entry[b"body"])
+    _decoded[key] = (generated_at, value)
+    return value
+
+
+def derive(key: str, value: Any, factory: Callable[[Any], Any]) -> Any:
+    """
+    Compute a value derived from a cached result once per refresh of that result.
+
+    Parameters:
+    key (str): A name for the derived value.
+    value (Any): A value returned by a coroutine decorated with cached().
+    factory (Callable[[Any], Any]): The function computing the derived value.
+
+    Returns:
+    Any: The result of factory(value), reused while the same cached result is returned.
+    """
+    derived = _derived.get(key)
+    if derived is not None and derived[0] is value:
+        return derived[1]
+    result = factory(value)
+    _derived[key] = (value, result)
+    return result
+
+
+async def _write(key: str, value: Any, ttl: int, stale: int) -> None:
+    """
+    Store a value in Redis as a hash of {generated_at, stale_at, body}.
+
+    Parameters:
+    key (str): The Redis key of the entry.
+    value (Any): A JSON-serializable value to store.
+    ttl (int): The number of seconds after which the entry is no longer fresh.
+    stale (int): The number of seconds after which the entry is removed from Redis.
+    """
+    now = time.time()
+    generated_at = repr(now).encode()
+    _decoded[key] = (generated_at, value)
+    mapping = {"generated_at": generated_at, "stale_at": now + ttl, "body": orjson.dumps(value)}
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            await pipe.hset(key, mapping=mapping).expire(key, stale).execute()
+    except RedisError as error:
+        logger.error(f"Failed to write cache entry {key}. Error: {error}")
+
+
+def cached(key: str, ttl: int, stale: int) -> Callable[[Callable[..., Awaitable]], Callable[..., Awaitable]]:
+    """
+    Cache the result of a coroutine in Redis.
+
+    A fresh entry is returned without calling the coroutine. Otherwise the coroutine is called and its
+    result is stored; concurrent calls made while the coroutine is running share its result instead of
+    calling it again. If the coroutine raises an HTTPException and an entry that has not yet expired is
+    available, that entry is returned instead of the error.
+
+    Parameters:
+    key (str): The Redis key of the entry.
+    ttl (int): The number of seconds during which the entry is served without calling the coroutine.
+    stale (int): The number of seconds during which the entry may still be served as a fallback.
+
+    Returns:
+    Callable: A decorator for the coroutine.
+    """
+
+    def decorator(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        async def refresh(entry: dict[bytes, bytes], *args, **kwargs) -> Any:
+            try:
+                result = await func(*args, **kwargs)
+            except HTTPException:
+                if not entry:
+                    raise
+                logger.warning(f"Serving stale cache entry {key} generated at {entry[b'generated_at'].decode()}")
+                return _decode(key, entry)
+            await _write(key, result, ttl, stale)
+            return result
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            entry = await _read(key)
+            if entry and time.time() < float(entry[b"stale_at"]):
+                return _decode(key, entry)
+            inflight = _inflight.get(key)
+            if inflight is None:
+                inflight = asyncio.ensure_future(refresh(entry, *args, **kwargs))
+                inflight.add_done_callback(lambda _: _inflight.pop(key, None))
+                _inflight[key] = inflight
+            # Shielded so that a cancelled caller does not cancel the refresh other callers are waiting for.
+            return await asyncio.shield(inflight)
+
+        return wrapper
+
+    return decorator
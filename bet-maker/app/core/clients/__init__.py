@@ -1 +1 @@
-from .line_provider_client import LineProviderClient
+from .line_provider_client import LineProviderClient, get_line_provider_client
@@ -1,23 +1,28 @@
 import logging
 
 import httpx
-from fastapi import HTTPException
-from fastapi.encoders import jsonable_encoder
+import orjson
+from fastapi import HTTPException, Request
 
 from app.config import settings
+from app.core.cache import cached, derive
 from app.utils import get_logger
 
 logger = get_logger(__file__, logging.DEBUG)
 
 
+def _event_ids(events: list) -> frozenset[str]:
+    return frozenset(event["event_id"] for event in events)
+
+
 class LineProviderClient:
+    def __init__(self, http_client: httpx.AsyncClient):
+        self._client = http_client
+
+    @cached(key="lp:active", ttl=5, stale=30)
     async def get_active_events(self) -> list:
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{settings.URL}/api_v1/events/"
-                response = await client.get(
-                    url=url, params={"format": "json"}, headers={"Content-Type": "application/json"}, timeout=10
-                )
+            response = await self._client.get("/api_v1/events/", params={"format": "json"})
 
         except (httpx.ConnectError, httpx.ConnectTimeout) as error:
             logger.error(f"Failed to connect to the server at {settings.URL}. Error: {error}")
@@ -32,16 +37,17 @@ class LineProviderClient:
                     status_code=response.status_code,
                     detail=f"Failed to fetch active events. Server returned status {response.status_code}",
                 )
-            events = jsonable_encoder(response.json())
+            events = orjson.loads(response.content)
             return events
 
+    async def get_active_event_ids(self) -> frozenset[str]:
+        events = await self.get_active_events()
+        return derive("lp:active:ids", events, _event_ids)
+
+    @cached(key="lp:completed", ttl=10, stale=60)
     async def get_completed_events(self) -> list:
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{settings.URL}/api_v1/events/get_past_events"
-                response = await client.get(
-                    url=url, params={"format": "json"}, headers={"Content-Type": "application/json"}, timeout=10
-                )
+            response = await self._client.get("/api_v1/events/get_past_events", params={"format": "json"})
 
         except (httpx.ConnectError, httpx.ConnectTimeout) as error:
             logger.error(f"Failed to connect to the server at {settings.URL}. Error: {error}")
@@ -56,5 +62,9 @@ class LineProviderClient:
                     status_code=response.status_code,
                     detail=f"Failed to fetch completed events. Server returned status {response.status_code}",
                 )
-            events = jsonable_encoder(response.json())
+            events = orjson.loads(response.content)
             return events
+
+
+def get_line_provider_client(request: Request) -> LineProviderClient:
+    return LineProviderClient(http_client=request.app.state.http_client)
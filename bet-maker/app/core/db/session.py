@@ -3,10 +3,20 @@ from __future__ import annotations
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
-async_engine = create_async_engine(url=settings.DB_URL, echo=True)
+async_engine = create_async_engine(
+    url=settings.DB_URL,
+    echo=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+)
 async_session = async_sessionmaker(async_engine, expire_on_commit=False)
 
 
@@ -1,2 +1,3 @@
 from .base import Base
 from .bets import Bet
+from .events import Event
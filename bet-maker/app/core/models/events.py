@@ -0,0 +1,12 @@
+import sqlalchemy.orm as so
+
+from app.core.models import Base
+
+
+class Event(Base):
+    """Local copy of the events currently accepting bets on the line provider."""
+
+    __tablename__ = "events"
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    event_id: so.Mapped[str] = so.mapped_column(unique=True, nullable=False, index=True)
+    deadline: so.Mapped[int] = so.mapped_column(nullable=False)
@@ -1 +1,2 @@
 from .bets import BetsRepository
+from .events import EventsRepository
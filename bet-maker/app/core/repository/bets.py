@@ -1,7 +1,6 @@
 from typing import Sequence
 
-from sqlalchemy import select
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy import Row, select, update
 
 from app.core.models import Bet
 from app.core.repository.repository import SqlAlchemyRepository
@@ -21,34 +20,33 @@ class BetsRepository(SqlAlchemyRepository):
         Returns:
         None: This function does not return any value. It updates the status of bets in the database.
         """
-        query = await self.session.execute(select(Bet).filter_by(status=BetState.NEW))
-        bets = query.scalars().all()
-        updated_bets = []
-
-        for bet in bets:
-            event_result = completed_events.get(bet.event_id)
-            if event_result:
-                bet.status = BetState.FINISHED_WIN if event_result == "2" else BetState.FINISHED_LOSE
-                updated_bets.append(bet)
-
-        self.session.add_all(updated_bets)
-
-    async def get_all_bets(self) -> Sequence[Bet]:
+        wins = [event_id for event_id, state in completed_events.items() if state == BetState.FINISHED_WIN.value]
+        loses = [event_id for event_id, state in completed_events.items() if state != BetState.FINISHED_WIN.value]
+        for event_ids, status in ((wins, BetState.FINISHED_WIN), (loses, BetState.FINISHED_LOSE)):
+            if event_ids:
+                await self.session.execute(
+                    update(Bet)
+                    .where(Bet.status == BetState.NEW, Bet.event_id.in_(event_ids))
+                    .values(status=status)
+                    .execution_options(synchronize_session=False)
+                )
+
+    async def get_all_bets(self) -> Sequence[Row]:
         """
         Retrieve all bets from the database.
 
-        This function executes a SQL query to select all records from the 'bets' table.
-        It then fetches and returns the result as a list of Bet objects.
+        This function executes a SQL query to select the columns of all records from the 'bets' table.
+        The rows are returned as plain tuples, without building a Bet object for each of them.
 
         Parameters:
         None: This function does not take any parameters.
 
         Returns:
-        Sequence[Bet]: A list of Bet objects representing all bets in the database.
+        Sequence[Row]: A list of (id, bet_id, event_id, amount, status) rows representing all bets in the database.
         """
-        query = select(Bet)
+        query = select(*Bet.__table__.columns)
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def get_bet_by_event_id(self, event_id: str) -> Bet | None:
         """
@@ -63,12 +61,7 @@ class BetsRepository(SqlAlchemyRepository):
         Returns:
         Bet | None: The retrieved Bet object if a match is found, or None if no match is found.
         """
-        query = await self.session.execute(select(Bet).filter_by(event_id=event_id))
-        try:
-            result = query.scalars().one()
-            return result
-        except NoResultFound:
-            return None
+        return await self.session.scalar(select(Bet).filter_by(event_id=event_id).limit(1))
 
     async def create_bet(self, bet: Bet) -> Bet:
         """
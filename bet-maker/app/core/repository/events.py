@@ -0,0 +1,48 @@
+import time
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.models import Event
+from app.core.repository.repository import SqlAlchemyRepository
+
+
+class EventsRepository(SqlAlchemyRepository):
+    model = Event
+
+    async def event_exists(self, event_id: str) -> bool:
+        """
+        Check if an active event with the given event_id exists in the local copy of events.
+
+        Parameters:
+        event_id (str): The unique identifier of the event.
+
+        Returns:
+        bool: True if the event exists and its deadline has not passed, False otherwise.
+        """
+        query = select(1).where(Event.event_id == event_id, Event.deadline > time.time()).limit(1)
+        result = await self.session.scalar(query)
+        return result is not None
+
+    async def sync_events(self, events: list, event_ids: frozenset[str]) -> None:
+        """
+        Replace the local copy of events with the active events of the line provider.
+
+        Events missing from the line provider are deleted, the rest are inserted or updated.
+
+        Parameters:
+        events (list): A list of dictionaries representing the active events of the line provider.
+        event_ids (frozenset[str]): The event IDs of the active events.
+
+        Returns:
+        None: This function does not return any value. It updates the events in the database.
+        """
+        await self.session.execute(delete(Event).where(Event.event_id.not_in(event_ids)))
+        if not events:
+            return
+        query = insert(Event).values(
+            [{"event_id": event["event_id"], "deadline": event["deadline"]} for event in events]
+        )
+        await self.session.execute(
+            query.on_conflict_do_update(index_elements=[Event.event_id], set_={"deadline": query.excluded.deadline})
+        )
@@ -4,6 +4,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, PositiveInt, field_validator
 
+CENT = Decimal("0.01")
+
 
 class BetState(enum.Enum):
     NEW = 1
@@ -19,8 +21,9 @@ class BetBase(BaseModel):
 
     @field_validator("amount")
     def validate_decimal_places(cls, value):
-        amount = Decimal(value).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
-        if amount != Decimal(value):
+        value = value if isinstance(value, Decimal) else Decimal(value)
+        amount = value.quantize(CENT, rounding=ROUND_DOWN)
+        if amount != value:
             raise ValueError("The amount must have no more than two decimal places")
         return amount
 
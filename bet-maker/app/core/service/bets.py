@@ -2,7 +2,6 @@ from fastapi import HTTPException
 
 from app.core.clients import LineProviderClient
 from app.core.models import Bet
-from app.core.schemas import Bet as BetSchema
 from app.core.schemas import BetCreate
 from app.core.service.service import BaseService
 from app.core.uow import UnitOfWork
@@ -12,20 +11,25 @@ class BetsService(BaseService):
     base_repository: str = "bets"
 
     @classmethod
-    async def __event_id_exist(cls, line_provider_client: LineProviderClient, event_id: str) -> bool:
+    async def __event_id_exist(cls, uow: UnitOfWork, line_provider_client: LineProviderClient, event_id: str) -> bool:
         """
-        Check if an event with the given event_id exists.
+        Check if an active event with the given event_id exists.
+
+        The local copy of events is checked first. If the event is not there, for example because it was
+        created after the last sync, the cached active event ids of the LineProviderClient are checked.
 
         Parameters:
+        uow (UnitOfWork): An instance of UnitOfWork for database operations.
         line_provider_client (LineProviderClient): An instance of LineProviderClient for making API calls.
         event_id (str): The unique identifier of the event.
 
         Returns:
         bool: True if an event with the given event_id exists, False otherwise.
         """
-        events_list = await line_provider_client.get_active_events()
-        result = any(event["event_id"] == event_id for event in events_list)
-        return True if result else False
+        async with uow:
+            if await uow.events.event_exists(event_id=event_id):
+                return True
+        return event_id in await line_provider_client.get_active_event_ids()
 
     @classmethod
     async def __bet_event_id_exist(cls, uow: UnitOfWork, event_id: str) -> bool:
@@ -40,7 +44,7 @@ class BetsService(BaseService):
         bool: True if a bet with the given event_id exists, False otherwise.
         """
         async with uow:
-            result = await uow.__dict__[cls.base_repository].get_bet_by_event_id(event_id=event_id)
+            result = await uow.bets.get_bet_by_event_id(event_id=event_id)
         return True if result else False
 
     @classmethod
@@ -59,12 +63,13 @@ class BetsService(BaseService):
         return events_dict
 
     @classmethod
-    async def __calculate_bets(cls, uow: UnitOfWork, line_provider_client: LineProviderClient) -> None:
+    async def calculate_bets(cls, uow: UnitOfWork, line_provider_client: LineProviderClient) -> None:
         """
         Calculate bets based on completed events fetched from the LineProviderClient.
 
-        This function fetches completed events from the LineProviderClient, retrieves the corresponding
-        bets from the database, and updates the bets' status based on the event states.
+        This function fetches completed events from the LineProviderClient and updates the status
+        of the corresponding bets in the database based on the event states.
+        It is run periodically in the background, so reading the bet history does not have to wait for it.
 
         Parameters:
         uow (UnitOfWork): An instance of UnitOfWork for database operations.
@@ -75,7 +80,28 @@ class BetsService(BaseService):
         """
         completed_events = await cls.__get_completed_events(line_provider_client=line_provider_client)
         async with uow:
-            await uow.__dict__[cls.base_repository].calculate_bets(completed_events=completed_events)
+            await uow.bets.calculate_bets(completed_events=completed_events)
+
+    @classmethod
+    async def sync_events(cls, uow: UnitOfWork, line_provider_client: LineProviderClient) -> None:
+        """
+        Copy the active events of the LineProviderClient into the database.
+
+        The local copy lets bet creation check that a synced event exists without calling the line provider.
+        The ids of the events to keep are taken from the same list as the events to upsert,
+        so a newer cache entry cannot bring back an event that the line provider has removed.
+
+        Parameters:
+        uow (UnitOfWork): An instance of UnitOfWork for database operations.
+        line_provider_client (LineProviderClient): An instance of LineProviderClient for making API calls.
+
+        Returns:
+        None: This function is asynchronous and does not return any value.
+        """
+        events = await line_provider_client.get_active_events()
+        event_ids = frozenset(event["event_id"] for event in events)
+        async with uow:
+            await uow.events.sync_events(events=events, event_ids=event_ids)
 
     @classmethod
     async def get_active_events(cls, line_provider_client: LineProviderClient) -> list:
@@ -91,30 +117,30 @@ class BetsService(BaseService):
         return await line_provider_client.get_active_events()
 
     @classmethod
-    async def get_bet_history(cls, uow: UnitOfWork, line_provider_client: LineProviderClient) -> list[BetSchema]:
+    async def get_bet_history(cls, uow: UnitOfWork) -> list[dict]:
         """
         Fetch and return a list of bets from the database, including their calculated status based on completed events.
 
-        This function first calls the __calculate_bets method to update the bets' status
-        based on completed events fetched from the LineProviderClient.
-        Then, it retrieves all bets from the database and returns them as a list of BetSchema objects.
+        The bets' status is kept up to date by the calculate_bets method running in the background.
+        This function retrieves all bets from the database and returns them as a list of dictionaries
+        ready to be serialized, without building a Bet schema object for each bet.
 
         Parameters:
         uow (UnitOfWork): An instance of UnitOfWork for database operations.
-        line_provider_client (LineProviderClient): An instance of LineProviderClient for making API calls.
 
         Returns:
-        list[BetSchema]: A list of BetSchema objects representing bets.
-        Each BetSchema object contains bet-specific information.
+        list[dict]: A list of dictionaries representing bets, with the same fields as the Bet schema.
         """
-        await cls.__calculate_bets(uow=uow, line_provider_client=line_provider_client)
         async with uow:
-            result = await uow.__dict__[cls.base_repository].get_all_bets()
-        bets = [bet.to_pydantic_schema() for bet in result]
+            result = await uow.bets.get_all_bets()
+        bets = [
+            {"id": pk, "bet_id": bet_id, "event_id": event_id, "amount": str(amount), "status": status}
+            for pk, bet_id, event_id, amount, status in result
+        ]
         return bets
 
     @classmethod
-    async def create_bet(cls, uow: UnitOfWork, bet: BetCreate, line_provider_client: LineProviderClient) -> BetSchema:
+    async def create_bet(cls, uow: UnitOfWork, line_provider_client: LineProviderClient, bet: BetCreate) -> Bet:
         """
         Create a new bet in the database.
 
@@ -122,21 +148,22 @@ class BetsService(BaseService):
         if a bet with the same event_id already exists in the database.
         If it does, it raises an HTTPException with a 400 status code and a descriptive error message.
         Otherwise, it creates a new Bet model instance using the provided BetCreate schema,
-        saves it to the database, and returns the created BetSchema object.
+        saves it to the database, and returns it.
+        The endpoint's response model reads the returned object's attributes, so no BetSchema is built here.
 
         Parameters:
         uow (UnitOfWork): An instance of UnitOfWork for database operations.
+        line_provider_client (LineProviderClient): An instance of LineProviderClient for making API calls.
         bet (BetCreate): A BetCreate schema object containing the necessary information for creating a new bet.
 
         Returns:
-        BetSchema: A BetSchema object representing the newly created bet.
+        Bet: The Bet model instance representing the newly created bet.
         """
-        if not await cls.__event_id_exist(line_provider_client=line_provider_client, event_id=bet.event_id):
+        if not await cls.__event_id_exist(uow=uow, line_provider_client=line_provider_client, event_id=bet.event_id):
             raise HTTPException(status_code=400, detail=f"Event with event_id {bet.event_id} does not exists!")
         if await cls.__bet_event_id_exist(uow=uow, event_id=bet.event_id):
             raise HTTPException(status_code=400, detail=f"Bet with event_id {bet.event_id} already exists!")
         bet_model = Bet(bet_id=bet.bet_id, event_id=bet.event_id, amount=bet.amount, status=bet.status)
         async with uow:
-            result = await uow.__dict__[cls.base_repository].create_bet(bet=bet_model)
-        created_bet = result.to_pydantic_schema()
-        return created_bet
+            result = await uow.bets.create_bet(bet=bet_model)
+        return result
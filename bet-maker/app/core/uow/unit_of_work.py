@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
 
 from app.core.db import async_session
-from app.core.repository import BetsRepository
+from app.core.repository import BetsRepository, EventsRepository
 
 
 class AbstractUnitOfWork(ABC):
     bets: BetsRepository
+    events: EventsRepository
 
     @abstractmethod
     def __init__(self):
@@ -37,6 +38,7 @@ class UnitOfWork(AbstractUnitOfWork):
     async def __aenter__(self):
         self.session = self.session_factory()
         self.bets = BetsRepository(self.session)
+        self.events = EventsRepository(self.session)
 
     async def __aexit__(self, exc_type, *args):
         if not exc_type:
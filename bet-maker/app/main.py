@@ -1,15 +1,63 @@
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator
+
+import httpx
 import uvicorn
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.api_v1 import api_router
 from app.config import settings
+from app.core.cache import redis_client
+from app.core.clients import LineProviderClient
+from app.core.service import BetsService
+from app.core.uow import UnitOfWork
+from app.utils import run_periodically
 
 root_router = APIRouter()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Manage resources shared by all requests for the lifetime of the application.
+
+    A single HTTP client is created on startup so that calls to the line provider reuse pooled
+    keep-alive connections instead of opening a new connection per request.
+    With settings.URL_HTTP2 enabled, concurrent requests are multiplexed over a single HTTP/2 connection.
+    Background tasks keep the local copy of active events in sync with the line provider
+    and calculate bets on completed events.
+    On shutdown the background tasks are cancelled and the HTTP client and the Redis connection pool are closed.
+
+    Parameters:
+    app (FastAPI): The application instance.
+    """
+    app.state.http_client = httpx.AsyncClient(
+        base_url=settings.URL,
+        http2=settings.URL_HTTP2,
+        timeout=10,
+        headers={"Content-Type": "application/json"},
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=30),
+    )
+    line_provider_client = LineProviderClient(http_client=app.state.http_client)
+    sync_events = partial(BetsService.sync_events, uow=UnitOfWork(), line_provider_client=line_provider_client)
+    calculate_bets = partial(BetsService.calculate_bets, uow=UnitOfWork(), line_provider_client=line_provider_client)
+    tasks = [
+        asyncio.create_task(run_periodically(sync_events, settings.EVENTS_SYNC_INTERVAL)),
+        asyncio.create_task(run_periodically(calculate_bets, settings.BETS_CALCULATION_INTERVAL)),
+    ]
+    yield
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await app.state.http_client.aclose()
+    await redis_client.close()
+
+
 def get_application() -> FastAPI:
-    app = FastAPI(title="Bet Maker FastAPI")
+    app = FastAPI(title="Bet Maker FastAPI", lifespan=lifespan)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -1 +1,2 @@
 from .logging import get_logger
+from .tasks import run_periodically
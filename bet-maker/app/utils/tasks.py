@@ -0,0 +1,27 @@
+"""Provides helpers to run background tasks."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from app.utils.logging import get_logger
+
+logger = get_logger(__file__, logging.DEBUG)
+
+
+async def run_periodically(func: Callable[[], Awaitable], interval: float) -> None:
+    """
+    Call a coroutine function forever, sleeping between calls.
+
+    Errors are logged and do not stop the loop.
+
+    Args:
+        func {Callable[[], Awaitable]}: coroutine function to call
+        interval {float}: number of seconds to sleep between calls
+    """
+    while True:
+        try:
+            await func()
+        except Exception:
+            logger.exception(f"Background task {func} failed")
+        await asyncio.sleep(interval)
@@ -1,63 +1,72 @@
 from fastapi import APIRouter, Depends
 
-from src.core.schemas import Event, EventCreate, EventUpdate
+from src.core.schemas import Event, EventCreate, EventDict, EventUpdate
 from src.core.service.events import EventsService
 from src.core.uow import UnitOfWork
+from src.deps import get_uow, json_body, json_body_openapi
+from src.utils.responses import MsgspecJSONResponse
 
 router = APIRouter()
 
 
 @router.get("/", status_code=200, response_model=list[Event])
-async def get_all_active_events(uow: UnitOfWork = Depends(UnitOfWork)) -> list[Event]:
+async def get_all_active_events(uow: UnitOfWork = Depends(get_uow)) -> MsgspecJSONResponse:
     """
     Retrieves all active events.
 
+    The events are returned as a MsgspecJSONResponse, so they are encoded by msgspec without being validated
+    against the response model, which is only used to document the endpoint.
+
     Parameters:
     uow (UnitOfWork): A dependency injection for UnitOfWork,
     which provides a single database session for the entire request.
 
     Returns:
-    list[Event]: A list of active Event objects.
+    MsgspecJSONResponse: A list of active Event objects.
     """
-    return await EventsService.get_all_active_events(uow=uow)
+    return MsgspecJSONResponse(content=await EventsService.get_all_active_events(uow=uow))
 
 
-@router.get("/get_event", status_code=200, response_model=Event)
-async def get_event_by_id(event_id: str, uow: UnitOfWork = Depends(UnitOfWork)) -> Event:
+@router.get("/get_event", status_code=200, response_model=EventDict)
+async def get_event_by_id(event_id: str) -> EventDict:
     """
     Retrieves a single event by its ID.
 
+    Concurrent requests for the same event share one query, which runs in its own UnitOfWork.
+
     Parameters:
     event_id (str): The unique identifier of the event to retrieve.
-    uow (UnitOfWork): A dependency injection for UnitOfWork,
-    which provides a single database session for the entire request.
 
     Returns:
-    Event: The requested Event object.
+    EventDict: The requested Event object.
     """
-    return await EventsService.get_event_by_id(uow=uow, event_id=event_id)
+    return await EventsService.get_event_by_id(event_id=event_id)
 
 
 @router.get("/get_past_events", status_code=200, response_model=list[Event])
-async def get_past_events(uow: UnitOfWork = Depends(UnitOfWork)) -> list[Event]:
+async def get_past_events(uow: UnitOfWork = Depends(get_uow)) -> MsgspecJSONResponse:
     """
     Retrieves a list of past events.
 
     This function is responsible for fetching all events that have already occurred.
     It uses the provided UnitOfWork (uow) to interact with the database.
+    The events are returned as a MsgspecJSONResponse, so they are encoded by msgspec without being validated
+    against the response model, which is only used to document the endpoint.
 
     Parameters:
     uow (UnitOfWork): A dependency injection for UnitOfWork,
     which provides a single database session for the entire request.
 
     Returns:
-    list[Event]: A list of Event objects representing past events.
+    MsgspecJSONResponse: A list of Event objects representing past events.
     """
-    return await EventsService.get_past_events(uow=uow)
+    return MsgspecJSONResponse(content=await EventsService.get_past_events(uow=uow))
 
 
-@router.post("/create_event", status_code=201, response_model=Event)
-async def create_event(event: EventCreate, uow: UnitOfWork = Depends(UnitOfWork)) -> Event:
+@router.post("/create_event", status_code=201, response_model=EventDict, openapi_extra=json_body_openapi(EventCreate))
+async def create_event(
+    event: EventCreate = Depends(json_body(EventCreate)), uow: UnitOfWork = Depends(get_uow)
+) -> EventDict:
     """
     Creates a new event in the system.
 
@@ -66,19 +75,21 @@ async def create_event(event: EventCreate, uow: UnitOfWork = Depends(UnitOfWork)
 
     Parameters:
     event (EventCreate): An object containing the details of the new event.
-        This object should be validated against the EventCreate schema.
+        The request body is parsed and validated against the EventCreate schema in a single pass.
     uow (UnitOfWork): A dependency injection for UnitOfWork,
         which provides a single database session for the entire request.
 
     Returns:
-    Event: The newly created Event object.
-        This object will be validated against the Event schema.
+    EventDict: The newly created Event object.
+        This dict will be validated against the EventDict schema.
     """
     return await EventsService.create_event(event=event, uow=uow)
 
 
-@router.put("/update_event", status_code=201, response_model=Event)
-async def update_event(event_id: str, event: EventUpdate, uow: UnitOfWork = Depends(UnitOfWork)) -> Event:
+@router.put("/update_event", status_code=201, response_model=EventDict, openapi_extra=json_body_openapi(EventUpdate))
+async def update_event(
+    event_id: str, event: EventUpdate = Depends(json_body(EventUpdate)), uow: UnitOfWork = Depends(get_uow)
+) -> EventDict:
     """
     Updates an existing event in the system.
 
@@ -88,19 +99,19 @@ async def update_event(event_id: str, event: EventUpdate, uow: UnitOfWork = Depe
     Parameters:
     event_id (str): The unique identifier of the event to update.
     event (EventUpdate): An object containing the updated details of the event.
-        This object should be validated against the EventUpdate schema.
+        The request body is parsed and validated against the EventUpdate schema in a single pass.
     uow (UnitOfWork): A dependency injection for UnitOfWork,
         which provides a single database session for the entire request.
 
     Returns:
-    Event: The updated Event object.
-        This object will be validated against the Event schema.
+    EventDict: The updated Event object.
+        This dict will be validated against the EventDict schema.
     """
     return await EventsService.update_event(event_id=event_id, event=event, uow=uow)
 
 
 @router.delete("/delete_event/{event_id}", status_code=204)
-async def delete_event(event_id: str, uow: UnitOfWork = Depends(UnitOfWork)) -> None:
+async def delete_event(event_id: str, uow: UnitOfWork = Depends(get_uow)) -> None:
     """
     Deletes an existing event from the system.
 
@@ -9,6 +9,12 @@ class Settings(BaseSettings):
     HOST: str = "line-provider-db"
     PORT: str = "5432"
     NAME: str = "line-provider"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    ACTIVE_EVENTS_CACHE_TTL: int = 5
+    EVENTS_OFFLOAD_THRESHOLD: int = 100
 
     @property
     def DB_URL(self):
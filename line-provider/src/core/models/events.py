@@ -3,7 +3,6 @@ import decimal
 import sqlalchemy.orm as so
 
 from src.core.models import Base
-from src.core.schemas import Event as EventSchema
 from src.core.schemas import EventState
 
 
@@ -15,7 +14,3 @@ class Event(Base):
     deadline: so.Mapped[int] = so.mapped_column(nullable=False)
     state: so.Mapped[EventState] = so.mapped_column(nullable=False)
 
-    def to_pydantic_schema(self) -> EventSchema:
-        return EventSchema(
-            id=self.id, event_id=self.event_id, coefficient=self.coefficient, deadline=self.deadline, state=self.state
-        )
@@ -1,54 +1,62 @@
-import random
 import time
 from typing import Sequence
 
-from sqlalchemy import desc, select
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy import ColumnElement, Row, case, delete, desc, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
 
 from src.core.models import Event
 from src.core.repository.repository import SqlAlchemyRepository
-from src.core.schemas import EventState, EventUpdate
+from src.core.schemas import EventState
 
 
 class EventsRepository(SqlAlchemyRepository):
     model = Event
 
-    async def __calculate_results(self, current_time: int) -> None:
+    async def __calculate_results(self, current_time: ColumnElement) -> None:
         """
         This function calculates the results of past events that have not been processed yet.
         It updates the state of these events to either FINISHED_WIN or FINISHED_LOSE randomly.
+        The result is drawn by the database for each row, so all events are updated with a single UPDATE statement.
+        It must be called inside the caller's transaction.
 
         Parameters:
-        current_time (int): The current time in Unix timestamp format. This is used to determine
-                            which events have passed their deadline.
+        current_time (ColumnElement): A SQL expression for the current time in Unix timestamp format.
+                                      This is used to determine which events have passed their deadline.
 
         Returns:
         None: This function does not return any value. It updates the state of events in the database.
         """
-        async with self.session.begin():
-            base_query = select(self.model).filter(
-                (self.model.deadline < current_time) & (self.model.state == EventState.NEW)
-            )
-            query = await self.session.execute(base_query.order_by(desc(self.model.deadline)))
-            events = query.scalars().all()
-            for event in events:
-                event.state = random.choice([EventState.FINISHED_WIN, EventState.FINISHED_LOSE])
-
-    async def get_all_active_events(self) -> Sequence[Event]:
+        state_type = self.model.state.type
+        result = case(
+            (func.random() < 0.5, literal(EventState.FINISHED_WIN, state_type)),
+            else_=literal(EventState.FINISHED_LOSE, state_type),
+        )
+        await self.session.execute(
+            update(self.model)
+            .where((self.model.deadline < current_time) & (self.model.state == EventState.NEW))
+            .values(state=result)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_all_active_events(self) -> Sequence[Row]:
         """
         Retrieves all active events from the database.
 
         Active events are those with a deadline greater than the current time.
+        The columns are selected directly, so no Event objects are built or tracked by the session.
 
         Parameters:
         None
 
         Returns:
-        Sequence[Event]: A sequence of Event objects representing the active events.
+        Sequence[Row]: A sequence of rows with the EventOut fields, representing the active events.
         """
-        base_query = select(self.model).filter(self.model.deadline > time.time())
+        # Listed in the field order of EventOut, which is built positionally from each row.
+        base_query = select(Event.id, Event.event_id, Event.coefficient, Event.deadline, Event.state).filter(
+            Event.deadline > time.time()
+        )
         query = await self.session.execute(base_query)
-        results = query.scalars().all()
+        results = query.all()
         return results
 
     async def get_event_by_id(self, event_id: str) -> Event | None:
@@ -61,98 +69,90 @@ class EventsRepository(SqlAlchemyRepository):
         Returns:
         Event | None: The retrieved event object if found, or None if no event with the given ID exists.
         """
-        query = await self.session.execute(select(Event).filter_by(event_id=event_id))
-        try:
-            result = query.scalars().one()
-            return result
-        except NoResultFound:
-            return None
-
-    async def get_past_events(self, current_time: int) -> Sequence[Event]:
+        return await self.session.scalar(select(Event).filter_by(event_id=event_id))
+
+    async def get_past_events(self) -> Sequence[Row]:
         """
         Retrieves past events from the database and updates their results if necessary.
 
         This function first calls the private method `__calculate_results` to update the results of
         past events that have not been processed yet. It then retrieves all past events from the
         database, ordered by their deadline in descending order.
+        Both steps run in the current transaction, which is committed by the caller's unit of work.
+        The current time is taken from the database clock, which is fixed for the duration of the transaction,
+        so both steps see the same set of past events.
+        The columns are selected directly, so no Event objects are built or tracked by the session.
 
         Parameters:
-        current_time (int): The current time in Unix timestamp format. This is used to determine
-                            which events have passed their deadline.
+        None
 
         Returns:
-        Sequence[Event]: A sequence of Event objects representing the past events.
+        Sequence[Row]: A sequence of rows with the EventOut fields, representing the past events.
         """
+        current_time = func.extract("epoch", func.now())
         await self.__calculate_results(current_time=current_time)
-        async with self.session.begin():
-            base_query = select(self.model).filter(self.model.deadline < current_time)
-            query = await self.session.execute(base_query.order_by(desc(self.model.deadline)))
-            results = query.scalars().all()
+        # Listed in the field order of EventOut, which is built positionally from each row.
+        base_query = select(Event.id, Event.event_id, Event.coefficient, Event.deadline, Event.state).filter(
+            Event.deadline < current_time
+        )
+        query = await self.session.execute(base_query.order_by(desc(self.model.deadline)))
+        results = query.all()
         return results
 
-    async def create_event(self, event: Event) -> Event:
+    async def create_event_if_absent(self, values: dict) -> Event | None:
         """
-        Creates a new event in the database.
+        Creates a new event in the database unless an event with the same unique identifier already exists.
 
-        This function takes an Event object as input and adds it to the database.
-        It uses an asynchronous context manager (async with) to handle database transactions.
+        The event is inserted with a single INSERT ... ON CONFLICT (event_id) DO NOTHING RETURNING statement,
+        so the existence check and the insert are atomic and take one round-trip. The statement runs within
+        the current transaction, which is committed by the caller's unit of work.
 
         Parameters:
-        event (Event): The Event object to be created in the database. This object should
-                       contain all the necessary information for the event, such as its
-                       unique identifier, title, description, deadline, and state.
+        values (dict): The column values of the new event, such as its unique identifier,
+                       coefficient, deadline, and state.
 
         Returns:
-        Event: The newly created Event object. This object will have its unique identifier
-               populated by the database.
+        Event | None: The newly created Event object with its primary key populated by the database,
+                      or None if an event with the given ID already exists.
         """
-        async with self.session.begin():
-            self.session.add(event)
-        return event
+        query = insert(Event).values(**values).on_conflict_do_nothing(index_elements=[Event.event_id]).returning(Event)
+        return await self.session.scalar(query)
 
-    async def update_event(self, event_id: str, event: EventUpdate) -> Event | None:
+    async def update_event(self, event_id: str, changes: dict) -> Event | None:
         """
         Updates an existing event in the database based on its unique identifier.
 
-        This function takes an event ID and an EventUpdate object as input. It retrieves the
-        corresponding event from the database, updates its attributes with the provided values,
-        and commits the changes to the database.
+        This function takes an event ID and a dictionary of the changed columns as input.
+        Only the provided columns are set, with a single UPDATE ... RETURNING statement,
+        which runs within the current transaction, committed by the caller's unit of work.
 
         Parameters:
         event_id (str): The unique identifier of the event to be updated.
-        event (EventUpdate): An object containing the updated attributes for the event.
-                             The object should only contain the attributes that need to be updated.
-                             Any attributes not present in the object will not be modified.
+        changes (dict): The new values of the columns to update, keyed by column name.
+                        Any columns not present in the dictionary will not be modified.
 
         Returns:
         Event | None: The updated Event object if the event was found and updated successfully.
                       Returns None if no event with the given ID was found in the database.
         """
-        async with self.session.begin():
-            query = await self.session.execute(select(Event).filter_by(event_id=event_id))
-            try:
-                db_event = query.scalars().one()
-                for field, value in event.dict(exclude_unset=True).items():
-                    setattr(db_event, field, value)
-            except NoResultFound:
-                return None
-        return db_event
-
-    async def delete_event(self, event_id: str) -> None:
+        if not changes:
+            return await self.get_event_by_id(event_id=event_id)
+        query = update(Event).filter_by(event_id=event_id).values(**changes).returning(Event)
+        return await self.session.scalar(query)
+
+    async def delete_event(self, event_id: str) -> bool:
         """
         Deletes an event from the database based on its unique identifier.
 
-        This function takes an event ID as input, retrieves the corresponding event from the database,
-        and deletes it from the database. It uses an asynchronous context manager (async with) to handle
-        database transactions.
+        This function takes an event ID as input and deletes the corresponding event from the database
+        with a single DELETE statement, which runs within the current transaction,
+        committed by the caller's unit of work.
 
         Parameters:
         event_id (str): The unique identifier of the event to be deleted.
 
         Returns:
-        None: This function does not return any value. It deletes the event from the database.
+        bool: True if the event was found and deleted, False if no event with the given ID exists.
         """
-        async with self.session.begin():
-            query = await self.session.execute(select(Event).filter_by(event_id=event_id))
-            db_event = query.scalars().one()
-            await self.session.delete(db_event)
+        result = await self.session.execute(delete(Event).filter_by(event_id=event_id))
+        return result.rowcount > 0
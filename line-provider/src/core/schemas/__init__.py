@@ -1 +1 @@
-from .events import Event, EventCreate, EventState, EventUpdate
+from .events import Event, EventCreate, EventDict, EventOut, EventState, EventUpdate
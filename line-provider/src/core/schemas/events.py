@@ -1,7 +1,9 @@
 import decimal
 import enum
 
-from pydantic import BaseModel, PositiveInt
+import msgspec
+from pydantic import BaseModel, ConfigDict, PositiveInt
+from typing_extensions import TypedDict
 
 
 class EventState(enum.Enum):
@@ -28,9 +30,33 @@ class EventUpdate(EventBase):
 class EventInDB(EventBase):
     id: PositiveInt
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Event(EventInDB):
-    pass
+    model_config = ConfigDict(frozen=True)
+
+
+class EventDict(TypedDict):
+    """Output-only representation of a single Event as a plain dict, with the same fields as the Event schema."""
+
+    id: int
+    event_id: str
+    coefficient: decimal.Decimal
+    deadline: int
+    state: EventState
+
+
+class EventOut(msgspec.Struct, frozen=True, gc=False):
+    """
+    Output-only representation of an Event, with the same JSON shape as the Event schema.
+
+    coefficient and state keep their Decimal and EventState values: msgspec encodes them
+    as a string and as the enum value natively, so no per-row conversion is needed in Python.
+    """
+
+    id: int
+    event_id: str
+    coefficient: decimal.Decimal
+    deadline: int
+    state: EventState
@@ -1,174 +1,296 @@
+import asyncio
 import time
+from itertools import starmap
+from typing import Sequence
 
 from fastapi import HTTPException
+from sqlalchemy import Row
 
+from src.config import settings
 from src.core.models import Event
-from src.core.schemas import Event as EventSchema
-from src.core.schemas import EventCreate, EventUpdate
+from src.core.schemas import EventCreate, EventDict, EventOut, EventUpdate
 from src.core.service.service import BaseService
 from src.core.uow import UnitOfWork
 
 
+_NOT_FOUND_TEMPLATE = "Event with event_id {} not found!"
+
+
+def _not_found(event_id: str) -> HTTPException:
+    """
+    Build the 404 HTTPException raised when an event does not exist.
+
+    Parameters:
+    event_id (str): The unique identifier of the missing event.
+
+    Returns:
+    HTTPException: The exception to raise.
+    """
+    return HTTPException(status_code=404, detail=_NOT_FOUND_TEMPLATE.format(event_id))
+
+
+def _event_to_dict(event: Event) -> EventDict:
+    """
+    Convert an Event model instance into an EventDict.
+
+    Parameters:
+    event (Event): The Event model instance to convert.
+
+    Returns:
+    EventDict: A dict representing the event.
+    """
+    return EventDict(
+        id=event.id,
+        event_id=event.event_id,
+        coefficient=event.coefficient,
+        deadline=event.deadline,
+        state=event.state,
+    )
+
+
+def _rows_to_structs(rows: Sequence[Row]) -> list[EventOut]:
+    """
+    Convert rows of the events table into EventOut structs.
+
+    The rows hold the columns selected by the repository in the field order of EventOut.
+
+    Parameters:
+    rows (Sequence[Row]): The rows to convert.
+
+    Returns:
+    list[EventOut]: A list of structs representing the events.
+    """
+    return list(starmap(EventOut, rows))
+
+
+async def _events_to_structs(rows: Sequence[Row]) -> list[EventOut]:
+    """
+    Convert rows of the events table into EventOut structs.
+
+    Results larger than settings.EVENTS_OFFLOAD_THRESHOLD are converted in a worker thread,
+    so a big conversion does not block the event loop. Smaller ones are converted inline,
+    where the thread hand-off would cost more than the conversion itself.
+
+    Parameters:
+    rows (Sequence[Row]): The rows to convert.
+
+    Returns:
+    list[EventOut]: A list of structs representing the events.
+    """
+    if len(rows) > settings.EVENTS_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(_rows_to_structs, rows)
+    return _rows_to_structs(rows)
+
+
 class EventsService(BaseService):
     base_repository: str = "events"
+    # Active events are served from memory until the cache expires or an event is created, updated or deleted.
+    _active_events: list[EventOut] | None = None
+    _active_events_expiry: float = 0
+    # Incremented on every invalidation. A read only stores its result if no invalidation happened while it ran.
+    _active_events_generation: int = 0
+    # Event lookups in progress, keyed by event_id. Concurrent lookups of the same event await the same query.
+    _inflight_events: dict[str, asyncio.Future] = {}
 
     @classmethod
-    async def __event_id_exist(cls, uow: UnitOfWork, event_id: str) -> bool:
+    async def get_all_active_events(cls, uow: UnitOfWork) -> list[EventOut]:
         """
-        Check if an event with the given event_id exists in the database.
+        Retrieve all active events from the database.
+
+        This function fetches all events from the database that are currently active.
+        An event is considered active if its state is set to 'active' and its deadline has not passed.
+        The result is cached in memory for settings.ACTIVE_EVENTS_CACHE_TTL seconds, but never past
+        the earliest deadline among the cached events, so an expired event is never served.
+        A result is not cached if the cache was invalidated while it was being fetched,
+        because it may have been read before the write that invalidated the cache was committed.
 
         Parameters:
-        uow (UnitOfWork): The UnitOfWork instance for database operations.
-        event_id (str): The unique identifier of the event to check.
+        uow (UnitOfWork): The UnitOfWork instance for database operations, already opened for the request.
 
         Returns:
-        bool: True if the event exists, False otherwise.
+        list[EventOut]: A list of EventOut structs representing the active events.
         """
-        async with uow:
-            result = await uow.__dict__[cls.base_repository].get_event_by_id(event_id=event_id)
-        return True if result else False
+        now = time.time()
+        if cls._active_events is not None and now < cls._active_events_expiry:
+            return cls._active_events
+        generation = cls._active_events_generation
+        result = await uow.events.get_all_active_events()
+        events = await _events_to_structs(result)
+        if generation == cls._active_events_generation:
+            cls._active_events = events
+            cls._active_events_expiry = min(
+                [now + settings.ACTIVE_EVENTS_CACHE_TTL, *(event.deadline for event in events)]
+            )
+        return events
 
     @classmethod
-    async def get_all_active_events(cls, uow: UnitOfWork) -> list[EventSchema]:
+    def __invalidate_active_events(cls) -> None:
         """
-        Retrieve all active events from the database.
+        Drop the cached active events, so the next read fetches them from the database.
+        Callers commit their changes first. Reads that were already running when the cache is dropped
+        do not store their result, since it may predate the commit.
+        """
+        cls._active_events = None
+        cls._active_events_generation += 1
 
-        This function fetches all events from the database that are currently active.
-        An event is considered active if its state is set to 'active' and its deadline has not passed.
+    @classmethod
+    def __forget_event_lookups(cls, *event_ids: str, task: asyncio.Future | None = None) -> None:
+        """
+        Drop the in-flight lookups of the given events, so later lookups start a fresh query.
+
+        Writes call this after committing, so a lookup started before the write is not joined
+        by requests made after it.
 
         Parameters:
-        uow (UnitOfWork): The UnitOfWork instance for database operations.
-        This instance provides a context manager for managing database transactions.
+        event_ids (str): The unique identifiers of the events.
+        task (asyncio.Future | None): If given, a lookup is only dropped if it is this task,
+        so a finished lookup does not drop a newer one started after a write.
+        """
+        for event_id in event_ids:
+            if task is None or cls._inflight_events.get(event_id) is task:
+                cls._inflight_events.pop(event_id, None)
+
+    @classmethod
+    async def __fetch_event(cls, event_id: str) -> EventDict | None:
+        """
+        Fetch an event by its unique identifier from the database.
+
+        The query runs in its own unit of work rather than in the session of the request that started it,
+        because it is shared with other requests and may outlive a cancelled one.
+
+        Parameters:
+        event_id (str): The unique identifier of the event to retrieve.
 
         Returns:
-        list[EventSchema]: A list of EventSchema objects representing the active events.
-        Each EventSchema object is a Pydantic model that corresponds to the Event model.
+        EventDict | None: A dict representing the retrieved event, or None if the event is not found.
         """
-        async with uow:
-            result = await uow.__dict__[cls.base_repository].get_all_active_events()
-        events = [event.to_pydantic_schema() for event in result]
-        return events
+        async with UnitOfWork() as uow:
+            result = await uow.events.get_event_by_id(event_id=event_id)
+        return _event_to_dict(result) if result else None
 
     @classmethod
-    async def get_event_by_id(cls, uow: UnitOfWork, event_id: str) -> EventSchema:
+    async def get_event_by_id(cls, event_id: str) -> EventDict:
         """
         Retrieve an event by its unique identifier from the database.
 
         This function fetches an event from the database using the provided event_id.
         If the event is not found, it raises a 404 HTTPException.
+        Concurrent calls for the same event_id share a single database query, and its result is returned
+        to all of them. Each call raises its own 404 HTTPException, so no exception instance is shared between requests.
 
         Parameters:
-        uow (UnitOfWork): The UnitOfWork instance for database operations.
-        This instance provides a context manager for managing database transactions.
-
         event_id (str): The unique identifier of the event to retrieve.
 
         Returns:
-        EventSchema: A Pydantic model representing the retrieved event.
-        Each EventSchema object corresponds to the Event model.
+        EventDict: A dict representing the retrieved event.
         If the event is not found, it raises a 404 HTTPException.
         """
-        async with uow:
-            result = await uow.__dict__[cls.base_repository].get_event_by_id(event_id=event_id)
-            if not result:
-                raise HTTPException(status_code=404, detail=f"Event with event_id {event_id} not found!")
-        event = result.to_pydantic_schema()
-        return event
+        inflight = cls._inflight_events.get(event_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(cls.__fetch_event(event_id=event_id))
+            inflight.add_done_callback(lambda task: cls.__forget_event_lookups(event_id, task=task))
+            cls._inflight_events[event_id] = inflight
+        # Shielded so that a cancelled caller does not cancel the query other callers are waiting for.
+        result = await asyncio.shield(inflight)
+        if result is None:
+            raise _not_found(event_id)
+        return result
 
     @classmethod
-    async def get_past_events(cls, uow: UnitOfWork) -> list[EventSchema]:
+    async def get_past_events(cls, uow: UnitOfWork) -> list[EventOut]:
         """
         Retrieve all past events from the database.
 
         This function fetches all events from the database that have already passed their deadline.
         An event is considered past if its deadline has already passed.
+        The results drawn for the past events are committed before they are returned,
+        so callers never act on results that could still be rolled back.
 
         Parameters:
-        uow (UnitOfWork): The UnitOfWork instance for database operations.
-        This instance provides a context manager for managing database transactions.
+        uow (UnitOfWork): The UnitOfWork instance for database operations, already opened for the request.
 
         Returns:
-        list[EventSchema]: A list of EventSchema objects representing the past events.
-        Each EventSchema object corresponds to the Event model.
+        list[EventOut]: A list of EventOut structs representing the past events.
         """
-        current_time = time.time()
-        async with uow:
-            result = await uow.__dict__[cls.base_repository].get_past_events(current_time=current_time)
-        events = [event.to_pydantic_schema() for event in result]
+        result = await uow.events.get_past_events()
+        await uow.commit()
+        events = await _events_to_structs(result)
         return events
 
     @classmethod
-    async def create_event(cls, uow: UnitOfWork, event: EventCreate) -> EventSchema:
+    async def create_event(cls, uow: UnitOfWork, event: EventCreate) -> EventDict:
         """
         Creates a new event in the database.
 
-        This function checks if an event with the same event_id already exists in the database.
-        If the event_id is unique, it creates a new Event model instance using the provided EventCreate schema,
-        sets the deadline as the current time plus the provided deadline, and inserts the event into the database.
-        If the event_id already exists, it raises a 400 HTTPException.
+        This function inserts a new event built from the provided EventCreate schema,
+        with the deadline set as the current time plus the provided deadline.
+        If an event with the same event_id already exists, nothing is inserted and it raises a 400 HTTPException.
+        The existence check and the insert are a single atomic statement, so concurrent requests cannot race.
 
         Parameters:
-        uow (UnitOfWork): The UnitOfWork instance for database operations.
+        uow (UnitOfWork): The UnitOfWork instance for database operations, already opened for the request.
         event (EventCreate): A Pydantic model representing the new event to be created.
 
         Returns:
-        EventSchema: A Pydantic model representing the newly created event.
+        EventDict: A dict representing the newly created event.
         """
-        if await cls.__event_id_exist(uow=uow, event_id=event.event_id):
+        values = {
+            "event_id": event.event_id,
+            "coefficient": event.coefficient,
+            "deadline": time.time_ns() // 1_000_000_000 + event.deadline,
+            "state": event.state,
+        }
+        result = await uow.events.create_event_if_absent(values=values)
+        if result is None:
             raise HTTPException(status_code=400, detail=f"Event with event_id {event.event_id} already exists!")
-        event_model = Event(
-            event_id=event.event_id,
-            coefficient=event.coefficient,
-            deadline=int(time.time() + event.deadline),
-            state=event.state,
-        )
-        async with uow:
-            result = await uow.__dict__[cls.base_repository].create_event(event=event_model)
-        created_event = result.to_pydantic_schema()
-        return created_event
+        await uow.commit()
+        cls.__forget_event_lookups(event.event_id)
+        cls.__invalidate_active_events()
+        return _event_to_dict(result)
 
     @classmethod
-    async def update_event(cls, event_id: str, event: EventUpdate, uow: UnitOfWork) -> EventSchema:
+    async def update_event(cls, event_id: str, event: EventUpdate, uow: UnitOfWork) -> EventDict:
         """
         Updates an existing event in the database.
 
         This function takes an event_id, an EventUpdate schema, and a UnitOfWork instance as parameters.
-        It first checks if an event with the given event_id exists in the database.
-        If the event exists, it updates the event's attributes with the provided EventUpdate schema.
+        Only the fields set in the provided EventUpdate schema are written, with a single UPDATE statement.
         If the event does not exist, it raises a 404 HTTPException.
 
         Parameters:
         event_id (str): The unique identifier of the event to update.
         event (EventUpdate): A Pydantic model representing the updated event data.
-        uow (UnitOfWork): The UnitOfWork instance for database operations.
+        uow (UnitOfWork): The UnitOfWork instance for database operations, already opened for the request.
 
         Returns:
-        EventSchema: A Pydantic model representing the updated event.
+        EventDict: A dict representing the updated event.
         """
-        async with uow:
-            result = await uow.__dict__[cls.base_repository].update_event(event_id=event_id, event=event)
-            if not result:
-                raise HTTPException(status_code=404, detail=f"Event with event_id {event_id} not found!")
-        updated_event = result.to_pydantic_schema()
-        return updated_event
+        changes = event.model_dump(exclude_unset=True)
+        result = await uow.events.update_event(event_id=event_id, changes=changes)
+        if not result:
+            raise _not_found(event_id)
+        await uow.commit()
+        cls.__forget_event_lookups(event_id, result.event_id)
+        cls.__invalidate_active_events()
+        return _event_to_dict(result)
 
     @classmethod
     async def delete_event(cls, event_id: str, uow: UnitOfWork) -> None:
         """
         Deletes an event from the database using the provided event_id.
 
-        This function first checks if an event with the given event_id exists in the database.
-        If the event exists, it deletes the event from the database.
+        If an event with the given event_id exists, it is deleted from the database.
         If the event does not exist, it raises a 404 HTTPException.
 
         Parameters:
         event_id (str): The unique identifier of the event to delete.
-        uow (UnitOfWork): The UnitOfWork instance for database operations.
+        uow (UnitOfWork): The UnitOfWork instance for database operations, already opened for the request.
 
         Returns:
         None: This function does not return any value.
         """
-        if not await cls.__event_id_exist(uow=uow, event_id=event_id):
-            raise HTTPException(status_code=404, detail=f"Event with event_id {event_id} not found!")
-        async with uow:
-            await uow.__dict__[cls.base_repository].delete_event(event_id=event_id)
+        if not await uow.events.delete_event(event_id=event_id):
+            raise _not_found(event_id)
+        await uow.commit()
+        cls.__forget_event_lookups(event_id)
+        cls.__invalidate_active_events()
@@ -37,6 +37,7 @@ class UnitOfWork(AbstractUnitOfWork):
     async def __aenter__(self):
         self.session = self.session_factory()
         self.events = EventsRepository(self.session)
+        return self
 
     async def __aexit__(self, exc_type, *args):
         if not exc_type:
@@ -0,0 +1,2 @@
+from .body import json_body, json_body_openapi
+from .uow import get_uow
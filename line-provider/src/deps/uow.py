@@ -0,0 +1,17 @@
+from typing import AsyncIterator
+
+from src.core.uow import UnitOfWork
+
+
+async def get_uow() -> AsyncIterator[UnitOfWork]:
+    """
+    Open a single UnitOfWork for the whole request.
+
+    All the services called by an endpoint share one session and one transaction.
+    Any changes left uncommitted are committed when the dependency is torn down, or rolled back if the endpoint
+    raises. Depending on the FastAPI version, this can happen after the response has been sent, so services
+    that write data commit explicitly before returning.
+    The session only connects to the database when the first query is made.
+    """
+    async with UnitOfWork() as uow:
+        yield uow
@@ -0,0 +1,20 @@
+"""Provides response classes."""
+
+from typing import Any
+
+import msgspec
+from fastapi.responses import JSONResponse
+
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSON response rendered with msgspec.
+
+    Used for msgspec.Struct content, which is encoded straight to JSON bytes
+    without going through pydantic-core or jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)